@@ -2,7 +2,11 @@
 """
 chfs-inject.py — Inject file ke disk.img yang sudah diformat ChilenaFS
 
-Usage: python3 chfs-inject.py <disk.img> <file> [--name nama_di_disk]
+Usage: python3 chfs-inject.py inject <disk.img> <file> [--name nama_di_disk]
+       python3 chfs-inject.py inject-batch <disk.img> <file[:nama]>...
+         (dipisah di ':' terakhir hanya kalau setelahnya nama tanpa '/';
+          path yang mengandung ':' ditulis dengan ':' di akhir, mis. a:b:)
+       python3 chfs-inject.py list <disk.img>
 
 ChilenaFS layout:
   Sektor 0      : Superblock
@@ -13,6 +17,7 @@ ChilenaFS layout:
 import sys
 import struct
 import argparse
+import mmap
 import os
 
 SECTOR_SIZE       = 512
@@ -25,170 +30,381 @@ MAX_INODES        = 64
 SUPERBLOCK_SECTOR = 0
 INODE_TABLE_START = 1
 DATA_START        = 9
+DATA_CHUNK        = SECTOR_SIZE * 64  # 32 KiB per write saat inject
 
 INODE_FREE = 0
 INODE_FILE = 1
 INODE_DIR  = 2
 
-def read_sector(disk, sector):
-    disk.seek(sector * SECTOR_SIZE)
-    return disk.read(SECTOR_SIZE)
-
-def write_sector(disk, sector, data):
-    assert len(data) == SECTOR_SIZE, f"Sector data must be {SECTOR_SIZE} bytes, got {len(data)}"
-    disk.seek(sector * SECTOR_SIZE)
-    disk.write(data)
-
-def read_superblock(disk):
-    data = read_sector(disk, SUPERBLOCK_SECTOR)
-    magic, version, inode_count, data_start = struct.unpack_from('<IIII', data, 0)
+# Superblock: magic, version, inode_count, data_start
+_SB_STRUCT    = struct.Struct('<IIII')
+# Inode: flags, name[48], size, start_sector, block_count, reserved[5]
+_INODE_STRUCT = struct.Struct('<B48sIIH5x')
+assert _INODE_STRUCT.size == INODE_SIZE
+# Sisa sektor superblock setelah field di atas
+_SB_PADDING   = bytes(SECTOR_SIZE - _SB_STRUCT.size)
+
+def write_sectors(fd, sector, data):
+    """Tulis beberapa sektor berurutan sekaligus"""
+    assert len(data) % SECTOR_SIZE == 0, f"Data must be a multiple of {SECTOR_SIZE} bytes, got {len(data)}"
+    offset = sector * SECTOR_SIZE
+    # pwrite boleh menulis sebagian, ulangi sampai semua data tertulis
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            with view[written:] as rest:
+                n = os.pwrite(fd, rest, offset + written)
+            if n == 0:
+                raise OSError(f"pwrite ke sektor {sector} tidak menulis apa-apa")
+            written += n
+
+def open_direct(disk_path):
+    """Buka disk dengan O_DIRECT (tanpa page cache), None kalau tidak didukung"""
+    if not hasattr(os, 'O_DIRECT'):
+        return None
+    try:
+        return os.open(disk_path, os.O_WRONLY | os.O_DIRECT)
+    except OSError:
+        return None
+
+def fadvise(fd, offset, length, advice):
+    """
+    Hint page cache ke kernel, sifatnya best-effort. advice = nama konstanta
+    os.POSIX_FADV_*; diabaikan kalau posix_fadvise tidak tersedia.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, getattr(os, advice))
+    except OSError:
+        pass
+
+def copy_data_blocks(f, file_size, disk_path, fd, start_sector, block_count):
+    """
+    Salin file_size byte dari f ke data blocks per DATA_CHUNK, pakai satu
+    buffer yang dipakai ulang. Buffer mmap anonim sudah page-aligned, jadi
+    bisa langsung dipakai untuk O_DIRECT; kalau O_DIRECT ditolak, lanjut
+    lewat fd biasa. OSError kalau file jadi lebih pendek saat dibaca.
+    """
+    direct_fd = open_direct(disk_path)
+    try:
+        with mmap.mmap(-1, DATA_CHUNK) as buf, \
+             memoryview(buf) as view:
+            # Input dibaca berurutan sekali jalan, minta readahead agresif
+            fadvise(f.fileno(), 0, 0, 'POSIX_FADV_SEQUENTIAL')
+
+            sector    = start_sector
+            remaining = block_count * SECTOR_SIZE
+            file_left = file_size
+            while remaining:
+                n    = min(DATA_CHUNK, remaining)
+                want = min(n, file_left)
+                with view[:n] as chunk:
+                    # Baca tepat sebanyak ukuran di inode, walau file bertambah
+                    with chunk[:want] as dst:
+                        got = f.readinto(dst)
+                    if got != want:
+                        raise OSError(f"{f.name}: ukuran file berubah saat dibaca")
+                    if want < n:
+                        # Sektor terakhir: pad sisa buffer dengan nol
+                        chunk[want:] = bytes(n - want)
+
+                    if direct_fd is not None:
+                        try:
+                            write_sectors(direct_fd, sector, chunk)
+                        except OSError:
+                            # Alignment tidak cocok dengan filesystem host
+                            os.close(direct_fd)
+                            direct_fd = None
+                    if direct_fd is None:
+                        write_sectors(fd, sector, chunk)
+
+                sector    += n // SECTOR_SIZE
+                remaining -= n
+                file_left -= want
+    finally:
+        if direct_fd is not None:
+            os.close(direct_fd)
+
+    # Data block tidak akan dibaca lagi oleh tool ini, lepas dari page cache
+    # (length 0 berarti sampai akhir file, jadi lewati file kosong)
+    if block_count:
+        fadvise(fd, start_sector * SECTOR_SIZE, block_count * SECTOR_SIZE,
+                'POSIX_FADV_DONTNEED')
+
+def parse_superblock(data):
+    magic, version, inode_count, data_start = _SB_STRUCT.unpack_from(data, 0)
     return {'magic': magic, 'version': version,
             'inode_count': inode_count, 'data_start': data_start}
 
-def write_superblock(disk, inode_count):
-    data = bytearray(SECTOR_SIZE)
-    struct.pack_into('<IIII', data, 0,
-        MAGIC, VERSION, inode_count, DATA_START)
-    write_sector(disk, SUPERBLOCK_SECTOR, bytes(data))
-
-def read_inode(disk, idx):
-    sector = INODE_TABLE_START + (idx // INODES_PER_SECTOR)
-    offset = (idx % INODES_PER_SECTOR) * INODE_SIZE
-    data   = read_sector(disk, sector)
-    raw    = data[offset:offset + INODE_SIZE]
-
-    flags        = raw[0]
-    name_bytes   = raw[1:49]
-    name         = name_bytes.split(b'\x00')[0].decode('utf-8', errors='replace')
-    size         = struct.unpack_from('<I', raw, 49)[0]
-    start_sector = struct.unpack_from('<I', raw, 53)[0]
-    block_count  = struct.unpack_from('<H', raw, 57)[0]
-
-    return {'flags': flags, 'name': name, 'size': size,
-            'start_sector': start_sector, 'block_count': block_count}
-
-def write_inode(disk, idx, flags, name, size, start_sector, block_count):
-    sector = INODE_TABLE_START + (idx // INODES_PER_SECTOR)
-    offset = (idx % INODES_PER_SECTOR) * INODE_SIZE
-
-    # Baca sektor yang ada dulu
-    sector_data = bytearray(read_sector(disk, sector))
-
-    # Build inode bytes
-    inode = bytearray(INODE_SIZE)
-    inode[0] = flags
-
-    name_bytes = name.encode('utf-8')[:47]
-    inode[1:1+len(name_bytes)] = name_bytes
-
-    struct.pack_into('<I', inode, 49, size)
-    struct.pack_into('<I', inode, 53, start_sector)
-    struct.pack_into('<H', inode, 57, block_count)
-
-    # Tulis inode ke sector data
-    sector_data[offset:offset + INODE_SIZE] = inode
-    write_sector(disk, sector, bytes(sector_data))
-
-def find_free_inode(disk):
-    for i in range(MAX_INODES):
-        inode = read_inode(disk, i)
-        if inode['flags'] == INODE_FREE:
-            return i
-    return None
-
-def find_next_free_sector(disk):
-    """Cari sektor data pertama yang bebas"""
+def read_superblock(fd):
+    # Cukup baca field superblock, bukan satu sektor penuh
+    return parse_superblock(os.pread(fd, _SB_STRUCT.size,
+                                     SUPERBLOCK_SECTOR * SECTOR_SIZE))
+
+def pack_superblock(inode_count):
+    return _SB_STRUCT.pack(MAGIC, VERSION, inode_count, DATA_START) + _SB_PADDING
+
+def load_inode_table(fd):
+    """
+    Baca seluruh inode table (8 sektor) sekaligus ke memori. Return None
+    kalau image terlalu pendek untuk memuat inode table lengkap.
+    """
+    size   = INODE_SECTORS * SECTOR_SIZE
+    offset = INODE_TABLE_START * SECTOR_SIZE
+    if hasattr(os, 'preadv'):
+        # Baca langsung ke buffer cache, tanpa copy dari bytes hasil pread
+        table = bytearray(size)
+        got   = os.preadv(fd, [table], offset)
+    else:
+        table = bytearray(os.pread(fd, size, offset))
+        got   = len(table)
+    return table if got == size else None
+
+def decode_name(name_bytes):
+    end = name_bytes.find(b'\x00')
+    if end >= 0:
+        name_bytes = name_bytes[:end]
+    return name_bytes.decode('utf-8', errors='replace')
+
+def set_inode(table, idx, flags, name, size, start_sector, block_count):
+    """Update inode di cache inode table, return sektor yang jadi dirty"""
+    # '48s' sudah pad nama dengan nol, '5x' mengisi reserved dengan nol
+    table[idx * INODE_SIZE:(idx + 1) * INODE_SIZE] = _INODE_STRUCT.pack(
+        flags, name.encode('utf-8')[:47], size, start_sector, block_count)
+    return INODE_TABLE_START + (idx // INODES_PER_SECTOR)
+
+def flush_metadata(fd, inode_count, table, dirty):
+    """
+    Tulis superblock + inode table sampai sektor dirty terakhir dalam satu
+    pwrite. Sektor di antaranya diambil dari cache yang isinya sama dengan
+    disk, jadi aman ikut ditulis ulang.
+    """
+    last  = max(dirty, default=SUPERBLOCK_SECTOR)
+    parts = (pack_superblock(inode_count),
+             memoryview(table)[:(last - INODE_TABLE_START + 1) * SECTOR_SIZE])
+    if hasattr(os, 'pwritev'):
+        # Tulis langsung dari superblock + cache, tanpa digabung dulu
+        written = os.pwritev(fd, parts, SUPERBLOCK_SECTOR * SECTOR_SIZE)
+        if written == sum(len(part) for part in parts):
+            return
+    # Tanpa pwritev atau tertulis sebagian: tulis ulang semuanya
+    write_sectors(fd, SUPERBLOCK_SECTOR, b''.join(parts))
+
+def scan_inode_table(table):
+    """
+    Satu kali jalan di inode table, return (free_idx, next_sector, names):
+      free_idx    = inode kosong pertama (None kalau penuh)
+      next_sector = sektor data pertama yang bebas
+      names       = dict nama -> index inode yang terpakai
+    """
+    free_idx = None
     next_sec = DATA_START
-    for i in range(MAX_INODES):
-        inode = read_inode(disk, i)
-        if inode['flags'] != INODE_FREE:
-            end = inode['start_sector'] + inode['block_count']
-            if end > next_sec:
-                next_sec = end
-    return next_sec
-
-def inject_file(disk_path, file_path, disk_name):
-    # Baca file yang mau diinject
-    with open(file_path, 'rb') as f:
-        file_data = f.read()
-
-    file_size = len(file_data)
+    names    = {}
+    # iter_unpack mem-parse semua inode di C, tanpa dict per inode
+    inodes = _INODE_STRUCT.iter_unpack(table)
+    for i, (flags, name_bytes, _, start_sector, block_count) in enumerate(inodes):
+        if flags == INODE_FREE:
+            if free_idx is None:
+                free_idx = i
+            continue
+        names.setdefault(decode_name(name_bytes), i)
+        end = start_sector + block_count
+        if end > next_sec:
+            next_sec = end
+    return free_idx, next_sec, names
+
+def open_chfs(disk_path):
+    """Buka disk, validasi superblock, dan load inode table ke cache"""
+    fd = os.open(disk_path, os.O_RDWR)
+    sb = read_superblock(fd)
+    if sb['magic'] != MAGIC:
+        os.close(fd)
+        print(f"ERROR: disk belum diformat ChilenaFS (magic={sb['magic']:#X})")
+        print("  Jalankan 'chfs-format' di Chilena dulu!")
+        sys.exit(1)
+
+    table = load_inode_table(fd)
+    if table is None:
+        os.close(fd)
+        print("ERROR: inode table tidak lengkap (image terlalu kecil)")
+        sys.exit(1)
+
+    print(f"  Disk OK    : {sb['inode_count']} file sudah ada")
+    return fd, sb, table
+
+def print_payload(f, file_path, disk_name):
+    """Print info file yang mau diinject, return ukurannya"""
+    # Isi file di-stream saat ditulis, di sini cukup ukurannya. Ambil dari
+    # handle yang sama dengan yang nanti dibaca, bukan stat path terpisah.
+    file_size = os.fstat(f.fileno()).st_size
     block_count = (file_size + SECTOR_SIZE - 1) // SECTOR_SIZE
 
     print(f"Injecting: {file_path} -> disk:{disk_name}")
     print(f"  Size       : {file_size} bytes ({block_count} sektor)")
+    return file_size
+
+def inject_one(fd, disk_path, sb, table, dirty, f, disk_name, file_size):
+    """
+    Tulis data file ke disk dan update inode di cache. Metadata belum
+    ditulis, sektor inode yang berubah dicatat di dirty. Return False
+    kalau tidak ada inode kosong. Kalau penyalinan data gagal (OSError),
+    inode lama yang di-overwrite dikembalikan selama extent-nya belum
+    tersentuh, lalu error diteruskan.
+    """
+    block_count = (file_size + SECTOR_SIZE - 1) // SECTOR_SIZE
+    inode_id, start_sector, names = scan_inode_table(table)
+    restore = None
+
+    # Cek apakah file sudah ada (overwrite)
+    existing_id = names.get(disk_name)
+    if existing_id is not None:
+        print(f"  Overwrite  : inode #{existing_id}")
+
+        # Hapus inode lama
+        old_inode = bytes(table[existing_id * INODE_SIZE:(existing_id + 1) * INODE_SIZE])
+        _, _, _, old_start, old_count = _INODE_STRUCT.unpack(old_inode)
+        dirty.add(set_inode(table, existing_id, INODE_FREE, '', 0, 0, 0))
+        sb['inode_count'] = max(0, sb['inode_count'] - 1)
+
+        # Inode & sektor lama sekarang bebas, scan ulang
+        inode_id, start_sector, names = scan_inode_table(table)
+
+        # Kalau data baru menimpa extent lama, inode lama harus sudah hilang
+        # di disk sebelum data ditulis. Kalau tidak, write yang gagal di
+        # tengah jalan meninggalkan file lama yang kelihatan valid tapi rusak.
+        if start_sector < old_start + old_count and \
+           old_start < start_sector + block_count:
+            flush_metadata(fd, sb['inode_count'], table, dirty)
+            dirty.clear()
+        else:
+            restore = (existing_id, old_inode)
+
+    if inode_id is None:
+        print("ERROR: tidak ada inode kosong (max 64 file)")
+        return False
+
+    print(f"  Inode      : #{inode_id}")
+    print(f"  Sektor     : {start_sector} - {start_sector + block_count - 1}")
+
+    # Tulis data ke disk
+    try:
+        copy_data_blocks(f, file_size, disk_path, fd, start_sector, block_count)
+    except OSError:
+        if restore is not None:
+            # Extent lama tidak ditimpa, file lama masih utuh
+            idx, raw = restore
+            table[idx * INODE_SIZE:(idx + 1) * INODE_SIZE] = raw
+            sb['inode_count'] += 1
+        raise
+
+    dirty.add(set_inode(table, inode_id, INODE_FILE, disk_name,
+                        file_size, start_sector, block_count))
+    sb['inode_count'] += 1
+    return True
 
-    with open(disk_path, 'r+b') as disk:
-        # Validasi superblock
-        sb = read_superblock(disk)
-        if sb['magic'] != MAGIC:
-            print(f"ERROR: disk belum diformat ChilenaFS (magic={sb['magic']:#X})")
-            print("  Jalankan 'chfs-format' di Chilena dulu!")
-            sys.exit(1)
-
-        print(f"  Disk OK    : {sb['inode_count']} file sudah ada")
-
-        # Cek apakah file sudah ada (overwrite)
-        existing_id = None
-        for i in range(MAX_INODES):
-            inode = read_inode(disk, i)
-            if inode['flags'] != INODE_FREE and inode['name'] == disk_name:
-                existing_id = i
-                print(f"  Overwrite  : inode #{i}")
-                break
-
-        if existing_id is not None:
-            # Hapus inode lama
-            write_inode(disk, existing_id, INODE_FREE, '', 0, 0, 0)
-            new_count = max(0, sb['inode_count'] - 1)
-            write_superblock(disk, new_count)
-            sb['inode_count'] = new_count
-
-        # Cari inode kosong
-        inode_id = find_free_inode(disk)
-        if inode_id is None:
-            print("ERROR: tidak ada inode kosong (max 64 file)")
-            sys.exit(1)
-
-        # Cari sektor kosong
-        start_sector = find_next_free_sector(disk)
-        print(f"  Inode      : #{inode_id}")
-        print(f"  Sektor     : {start_sector} - {start_sector + block_count - 1}")
-
-        # Tulis data ke disk
-        for i in range(block_count):
-            sector_data = bytearray(SECTOR_SIZE)
-            src_start = i * SECTOR_SIZE
-            src_end   = min(src_start + SECTOR_SIZE, file_size)
-            chunk     = file_data[src_start:src_end]
-            sector_data[:len(chunk)] = chunk
-            write_sector(disk, start_sector + i, bytes(sector_data))
+def inject_file(disk_path, file_path, disk_name):
+    with open(file_path, 'rb') as f:
+        file_size = print_payload(f, file_path, disk_name)
 
-        # Tulis inode
-        write_inode(disk, inode_id, INODE_FILE, disk_name,
-                    file_size, start_sector, block_count)
+        fd, sb, table = open_chfs(disk_path)
+        try:
+            # Perubahan metadata dikumpulkan di cache, ditulis sekali di akhir
+            dirty = set()
+            if not inject_one(fd, disk_path, sb, table, dirty,
+                              f, disk_name, file_size):
+                sys.exit(1)
 
-        # Update superblock
-        write_superblock(disk, sb['inode_count'] + 1)
+            # Tulis inode + superblock setelah data aman di disk
+            flush_metadata(fd, sb['inode_count'], table, dirty)
+        finally:
+            os.close(fd)
 
     print(f"  SELESAI    : '{disk_name}' berhasil diinject!")
     print(f"  Di Chilena : run {disk_name}")
 
+def inject_batch(disk_path, files):
+    """
+    Inject banyak file sekaligus: disk dibuka dan inode table dibaca sekali,
+    metadata semua file ditulis sekali di akhir. files = list (path, nama).
+    """
+    fd, sb, table = open_chfs(disk_path)
+    done = 0
+    try:
+        dirty = set()
+        for file_path, disk_name in files:
+            try:
+                with open(file_path, 'rb') as f:
+                    file_size = print_payload(f, file_path, disk_name)
+                    ok = inject_one(fd, disk_path, sb, table, dirty,
+                                    f, disk_name, file_size)
+            except OSError as e:
+                # Input hilang / tidak bisa dibaca: berhenti seperti inode penuh
+                print(f"ERROR: gagal inject '{file_path}': {e.strerror or e}")
+                ok = False
+            if not ok:
+                break
+            print(f"  SELESAI    : '{disk_name}' berhasil diinject!")
+            done += 1
+
+        # File yang sudah berhasil tetap disimpan walau ada yang gagal
+        flush_metadata(fd, sb['inode_count'], table, dirty)
+    finally:
+        os.close(fd)
+
+    print(f"Batch: {done}/{len(files)} file diinject")
+    if done < len(files):
+        sys.exit(1)
+
+def parse_file_spec(spec):
+    """
+    Pecah argumen inject-batch 'file[:nama]' jadi (path, nama). ':' terakhir
+    cuma dianggap pemisah kalau sisanya nama polos tanpa '/', jadi path
+    seperti out/v1:2/hello.chn tetap utuh. ':' di akhir = tanpa nama.
+    """
+    path, sep, name = spec.rpartition(':')
+    if not sep or not path or '/' in name or os.sep in name:
+        path, name = spec, ''
+    return path, name or os.path.basename(path)
+
 def list_files(disk_path):
-    with open(disk_path, 'rb') as disk:
-        sb = read_superblock(disk)
+    # Map area metadata saja (superblock + inode table), akses jadi slice biasa
+    fd = os.open(disk_path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size < DATA_START * SECTOR_SIZE:
+            # Terlalu kecil untuk di-map, cek magic saja untuk pesan error
+            head = os.pread(fd, _SB_STRUCT.size, SUPERBLOCK_SECTOR * SECTOR_SIZE)
+            sb = parse_superblock(head.ljust(_SB_STRUCT.size, b'\x00'))
+            if sb['magic'] != MAGIC:
+                print(f"ERROR: bukan ChilenaFS (magic={sb['magic']:#X})")
+            else:
+                print("ERROR: inode table tidak lengkap (image terlalu kecil)")
+            sys.exit(1)
+
+        mm = mmap.mmap(fd, DATA_START * SECTOR_SIZE, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+    with mm:
+        sb = parse_superblock(mm)
         if sb['magic'] != MAGIC:
             print(f"ERROR: bukan ChilenaFS (magic={sb['magic']:#X})")
             sys.exit(1)
 
-        print(f"ChilenaFS — {sb['inode_count']} file:")
-        print(f"  {'ID':<4}  {'SIZE':<8}  {'SEKTOR':<8}  NAME")
-        print(f"  {'-'*40}")
-        for i in range(MAX_INODES):
-            inode = read_inode(disk, i)
-            if inode['flags'] != INODE_FREE:
-                kind = 'FILE' if inode['flags'] == INODE_FILE else 'DIR'
-                print(f"  {i:<4}  {inode['size']:<8}  {inode['start_sector']:<8}  {inode['name']} [{kind}]")
+        table = mm[INODE_TABLE_START * SECTOR_SIZE:DATA_START * SECTOR_SIZE]
+
+    # Kumpulkan semua baris dulu, lalu tulis ke stdout sekali
+    lines = [
+        f"ChilenaFS — {sb['inode_count']} file:",
+        f"  {'ID':<4}  {'SIZE':<8}  {'SEKTOR':<8}  NAME",
+        f"  {'-'*40}",
+    ]
+    inodes = _INODE_STRUCT.iter_unpack(table)
+    for i, (flags, name_bytes, size, start_sector, _) in enumerate(inodes):
+        if flags != INODE_FREE:
+            kind = 'FILE' if flags == INODE_FILE else 'DIR'
+            lines.append(f"  {i:<4}  {size:<8}  {start_sector:<8}  {decode_name(name_bytes)} [{kind}]")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='ChilenaFS disk injector')
@@ -200,6 +416,13 @@ if __name__ == '__main__':
     p_inject.add_argument('file',  help='File yang diinject')
     p_inject.add_argument('--name', help='Nama di disk (default: basename file)')
 
+    # inject-batch command
+    p_batch = sub.add_parser('inject-batch', help='Inject banyak file ke disk sekaligus')
+    p_batch.add_argument('disk',  help='Path ke disk.img')
+    p_batch.add_argument('files', nargs='+', metavar='file[:nama]',
+                         help="File yang diinject, opsional dengan nama di disk "
+                              "(path yang mengandung ':' tulis dengan ':' di akhir)")
+
     # list command
     p_list = sub.add_parser('list', help='List file di disk')
     p_list.add_argument('disk', help='Path ke disk.img')
@@ -209,6 +432,8 @@ if __name__ == '__main__':
     if args.cmd == 'inject':
         name = args.name or os.path.basename(args.file)
         inject_file(args.disk, args.file, name)
+    elif args.cmd == 'inject-batch':
+        inject_batch(args.disk, [parse_file_spec(spec) for spec in args.files])
     elif args.cmd == 'list':
         list_files(args.disk)
     else:
@@ -27,6 +27,25 @@ CHN_VERSION  = 1
 CHN_FLAGS    = 0x0001  # executable
 CHN_ARCH     = 0x0001  # x86_64
 
+CHN_HEADER_SIZE = 32
+
+# Header tanpa checksum (31 bytes)
+_CHN_HEADER = struct.Struct('<4sHHIIIIIHB')
+assert _CHN_HEADER.size == CHN_HEADER_SIZE - 1, f"Header size salah: {_CHN_HEADER.size}"
+
+def xor_fold(data: bytes) -> int:
+    """XOR semua byte di data: baca sebagai satu int, lalu lipat setengah-setengah"""
+    x = int.from_bytes(data, 'little')
+    # Lebar lipatan pertama = pangkat dua terkecil (dalam bit) >= panjang data
+    shift = 8
+    while shift < len(data) * 8:
+        shift *= 2
+    # Tiap langkah XOR setengah atas ke setengah bawah, sampai tinggal 8 bit
+    while shift > 8:
+        shift //= 2
+        x ^= x >> shift
+    return x & 0xFF
+
 def pack_chn(input_path: str, output_path: str, stack_size: int = 65536):
     with open(input_path, 'rb') as f:
         code = f.read()
@@ -36,8 +55,9 @@ def pack_chn(input_path: str, output_path: str, stack_size: int = 65536):
     min_memory = code_size + stack_size
 
     # Build header (31 bytes dulu, lalu hitung checksum)
-    header_no_checksum = struct.pack(
-        '<4sHHIIIIIHB',
+    header = bytearray(CHN_HEADER_SIZE)
+    _CHN_HEADER.pack_into(
+        header, 0,
         CHN_MAGIC,       # 4 bytes magic
         CHN_VERSION,     # 2 bytes version
         CHN_FLAGS,       # 2 bytes flags
@@ -49,17 +69,12 @@ def pack_chn(input_path: str, output_path: str, stack_size: int = 65536):
         CHN_ARCH,        # 2 bytes target_arch
         1,               # 1 byte os_version
     )
-    # Total sekarang = 31 bytes
-    assert len(header_no_checksum) == 31, f"Header size salah: {len(header_no_checksum)}"
 
-    # Hitung checksum = XOR semua 31 bytes
-    checksum = 0
-    for b in header_no_checksum:
-        checksum ^= b
+    # Hitung checksum = XOR semua 31 bytes (byte checksum masih 0)
+    checksum = xor_fold(header)
 
     # Full header = 31 bytes + 1 byte checksum = 32 bytes
-    header = header_no_checksum + bytes([checksum])
-    assert len(header) == 32, f"Full header size salah: {len(header)}"
+    header[CHN_HEADER_SIZE - 1] = checksum
 
     # Tulis output
     with open(output_path, 'wb') as f: